@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('MIRROR_DATABASE_URL', 'sqlite://')
+
+import fake_firestore  # noqa: E402
+
+FAKE_DB = fake_firestore.install()
+
+import app as app_module  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+# Objek fake diperlakukan seperti objek google.cloud.firestore oleh lapisan resiliensi
+app_module.FIRESTORE_MODULES = app_module.FIRESTORE_MODULES + ('fake_firestore',)
+for real, fake in [('DocumentReference', 'DocRef'), ('CollectionReference', 'CollRef'),
+                   ('AggregationQuery', 'AggQuery'), ('Client', 'FakeDB')]:
+    if real in app_module.REMOTE_READS: app_module.REMOTE_READS[fake] = app_module.REMOTE_READS[real]
+for real, fake in [('DocumentReference', 'DocRef'), ('CollectionReference', 'CollRef'), ('WriteBatch', 'Batch')]:
+    if real in app_module.REMOTE_WRITES: app_module.REMOTE_WRITES[fake] = app_module.REMOTE_WRITES[real]
+
+# Mirror SQL dimuat malas; dibuat sebelum request pertama seperti pada perintah CLI
+app_module.mirror_models()
+
+
+@pytest.fixture
+def app():
+    return app_module
+
+
+@pytest.fixture
+def db(app):
+    FAKE_DB.reset()
+    FAKE_DB.data['users'] = {'1': {'username': 'admin', 'password_hash': generate_password_hash('rahasia')}}
+    app.shared_cache = app.SharedCache(app.MemoryCacheBackend())
+    app.firestore_breaker.__init__()
+    app._user_cache.clear()
+    app.admission.store = app.MemoryRateLimitStore()
+    yield FAKE_DB
+    app.write_queue.flush()
+
+
+@pytest.fixture
+def client(app, db):
+    c = app.app.test_client()
+    c.post('/login', data={'username': 'admin', 'password': 'rahasia'})
+    return c
@@ -0,0 +1,234 @@
+"""Firestore in-memory untuk test: cukup untuk query, batch, get_all dan agregasi yang dipakai app.py."""
+import sys, types, copy, itertools
+
+_counter = itertools.count(1)
+
+class AlreadyExists(Exception): pass
+class NotFound(Exception): pass
+
+class Increment:
+    def __init__(self, v): self.value = v
+
+class ArrayUnion:
+    def __init__(self, v): self.values = list(v)
+class ArrayRemove:
+    def __init__(self, v): self.values = list(v)
+
+class _Sentinel:
+    def __init__(self, n): self.n = n
+DELETE_FIELD = _Sentinel('DELETE')
+SERVER_TIMESTAMP = _Sentinel('TS')
+
+class Snap:
+    def __init__(self, ref, data):
+        self.reference = ref; self.id = ref.id; self._d = data
+        self.exists = data is not None
+        self.update_time = None; self.create_time = None
+    def to_dict(self): return copy.deepcopy(self._d) if self._d is not None else None
+    def get(self, f): return (self._d or {}).get(f)
+
+class DocRef:
+    def __init__(self, db, col, id):
+        self._db = db; self.id = id; self._col = col
+        self.path = f"{col}/{id}"
+        self.parent = CollRef(db, col)
+    def _store(self): return self._db.data.setdefault(self._col, {})
+    def get(self, *a, **k):
+        self._db.reads += 1
+        return Snap(self, copy.deepcopy(self._store().get(self.id)))
+    def set(self, data, merge=False, **k):
+        cur = self._store().get(self.id) if merge else None
+        new = dict(cur or {})
+        for k, v in data.items():
+            if isinstance(v, Increment): new[k] = (new.get(k) or 0) + v.value
+            elif isinstance(v, ArrayUnion): new[k] = list(new.get(k) or []) + [x for x in v.values if x not in (new.get(k) or [])]
+            elif isinstance(v, ArrayRemove): new[k] = [x for x in (new.get(k) or []) if x not in v.values]
+            elif v is DELETE_FIELD: new.pop(k, None)
+            elif v is SERVER_TIMESTAMP:
+                import datetime as _d; new[k] = _d.datetime.now(_d.timezone.utc)
+            else: new[k] = copy.deepcopy(v)
+        self._store()[self.id] = new
+    def update(self, data, **k):
+        if self.id not in self._store(): raise NotFound(self.path)
+        self.set(data, merge=True)
+    def create(self, data, **k):
+        if self.id in self._store(): raise AlreadyExists(self.path)
+        self.set(data)
+    def delete(self, **k): self._store().pop(self.id, None)
+    def collection(self, name): return CollRef(self._db, f"{self._col}/{self.id}/{name}")
+
+class Query:
+    def __init__(self, db, col, filters=(), orders=(), lim=None, start=None, start_incl=True, offset=0, end=None, end_incl=True, select=None):
+        self._db = db; self._col = col; self.f = list(filters); self.o = list(orders); self.lim = lim
+        self.start = start; self.start_incl = start_incl; self.end = end; self.end_incl = end_incl; self.off = offset; self.sel = select
+    def _c(self, **kw):
+        d = dict(filters=self.f, orders=self.o, lim=self.lim, start=self.start, start_incl=self.start_incl, offset=self.off, end=self.end, end_incl=self.end_incl, select=self.sel); d.update(kw)
+        return Query(self._db, self._col, **d)
+    def where(self, *args, filter=None, **kw):
+        if filter is not None: a, op, b = filter.field_path, filter.op_string, filter.value
+        else: a, op, b = args
+        return self._c(filters=self.f + [(a, op, b)])
+    def order_by(self, field, direction='ASCENDING'): return self._c(orders=self.o + [(field, direction)])
+    def limit(self, n): return self._c(lim=n)
+    def offset(self, n): return self._c(offset=n)
+    def select(self, fields): return self._c(select=list(fields))
+    def start_after(self, v): return self._c(start=v, start_incl=False)
+    def start_at(self, v): return self._c(start=v, start_incl=True)
+    def end_at(self, v): return self._c(end=v, end_incl=True)
+    def end_before(self, v): return self._c(end=v, end_incl=False)
+    def _val(self, id, d, f): return id if f == '__name__' else d.get(f)
+    def _cursor(self, v):
+        if isinstance(v, Snap): return tuple(self._val(v.id, v._d or {}, f) for f, _ in self._orders())
+        if isinstance(v, dict): return tuple(v.get(f) for f, _ in self._orders())
+        if isinstance(v, (list, tuple)): return tuple(v)
+        return (v,)
+    def _orders(self): return self.o or [('__name__', 'ASCENDING')]
+    def _run(self):
+        self._db.queries += 1
+        items = list(self._db.data.get(self._col, {}).items())
+        def ok(id, d):
+            for a, op, b in self.f:
+                v = self._val(id, d, a)
+                if a == '__name__' and isinstance(b, DocRef): b = b.id
+                if op == '==' and v != b: return False
+                if op == '!=' and v == b: return False
+                if op == 'in' and v not in b: return False
+                if op == 'array_contains' and b not in (v or []): return False
+                if op in ('<', '<=', '>', '>='):
+                    if v is None: return False
+                    try:
+                        if not {'<': v < b, '<=': v <= b, '>': v > b, '>=': v >= b}[op]: return False
+                    except TypeError: return False
+            return True
+        items = [(i, d) for i, d in items if ok(i, d)]
+        orders = self._orders()
+        for f, _ in orders:
+            if f != '__name__': items = [(i, d) for i, d in items if d.get(f) is not None]
+        for f, dr in reversed(orders):
+            items.sort(key=lambda x: self._val(x[0], x[1], f), reverse=(dr in ('DESCENDING', 'desc')))
+        def key(x): return tuple(self._val(x[0], x[1], f) for f, _ in orders)
+        def cmp(a, b):
+            for (f, dr), x, y in zip(orders, a, b):
+                if x == y: continue
+                lt = x < y
+                if dr in ('DESCENDING', 'desc'): lt = not lt
+                return -1 if lt else 1
+            return 0
+        if self.start is not None:
+            c = self._cursor(self.start)
+            items = [x for x in items if (cmp(key(x)[:len(c)], c) >= 0 if self.start_incl else cmp(key(x)[:len(c)], c) > 0)]
+        if self.end is not None:
+            c = self._cursor(self.end)
+            items = [x for x in items if (cmp(key(x)[:len(c)], c) <= 0 if self.end_incl else cmp(key(x)[:len(c)], c) < 0)]
+        items = items[self.off:]
+        if self.lim is not None: items = items[:self.lim]
+        out = []
+        for i, d in items:
+            self._db.reads += 1
+            dd = copy.deepcopy(d)
+            if self.sel is not None: dd = {k: v for k, v in dd.items() if k in self.sel}
+            out.append(Snap(DocRef(self._db, self._col, i), dd))
+        return out
+    def stream(self, *a, **k): return iter(self._run())
+    def get(self, *a, **k): return self._run()
+    def count(self, alias=None): return AggQuery(self)
+    def sum(self, field, alias=None): return AggQuery(self, field)
+    def on_snapshot(self, cb):
+        w = types.SimpleNamespace(unsubscribe=lambda: None); self._db.listeners.append((self, cb)); return w
+
+class AggResult:
+    def __init__(self, v): self.value = v; self.alias = 'count'
+class AggQuery:
+    def __init__(self, q, field=None): self.q = q; self.field = field
+    def get(self, *a, **k):
+        docs = self.q._c(lim=None)._run()
+        if self.field: return [[AggResult(sum((d._d or {}).get(self.field) or 0 for d in docs))]]
+        return [[AggResult(len(docs))]]
+
+class CollRef(Query):
+    def __init__(self, db, col):
+        super().__init__(db, col); self.id = col.split('/')[-1]
+    def document(self, id=None):
+        return DocRef(self._db, self._col, str(id) if id is not None else f"auto{next(_counter):08d}")
+    def add(self, data, **k):
+        r = self.document(); r.set(data); return (None, r)
+    def list_documents(self, **k): return iter([DocRef(self._db, self._col, i) for i in list(self._db.data.get(self._col, {}))])
+
+class Batch:
+    def __init__(self, db): self.db = db; self.ops = []
+    def set(self, ref, data, merge=False): self.ops.append(('set', ref, data, merge)); return self
+    def update(self, ref, data): self.ops.append(('update', ref, data, None)); return self
+    def delete(self, ref): self.ops.append(('delete', ref, None, None)); return self
+    def create(self, ref, data): self.ops.append(('create', ref, data, None)); return self
+    def __len__(self): return len(self.ops)
+    def commit(self, *a, **k):
+        if len(self.ops) > 500: raise Exception("batch too large")
+        # Validasi dulu agar batch atomik: satu operasi gagal = tidak ada yang ditulis
+        exists = {}
+        for op, ref, data, merge in self.ops:
+            present = exists.get(ref.path, ref.id in ref._store())
+            if op == 'create' and present: self.ops = []; raise AlreadyExists(ref.path)
+            if op == 'update' and not present: self.ops = []; raise NotFound(ref.path)
+            exists[ref.path] = op != 'delete'
+        self.db.commits += 1
+        for op, ref, data, merge in self.ops:
+            if op == 'set': ref.set(data, merge=merge)
+            elif op == 'update': ref.update(data)
+            elif op == 'create': ref.create(data)
+            else: ref.delete()
+        self.ops = []
+
+class Transaction(Batch):
+    def __init__(self, db): super().__init__(db); self._read_only = False; self._id = None
+    def get(self, ref_or_q, *a, **k):
+        if isinstance(ref_or_q, DocRef): return iter([ref_or_q.get()]) if False else ref_or_q.get()
+        return ref_or_q.stream()
+    def _begin(self, *a, **k): pass
+    def _rollback(self, *a, **k): self.ops = []
+    def _commit(self, *a, **k): self.commit(); return []
+
+def transactional(fn):
+    def wrapper(txn, *a, **k):
+        r = fn(txn, *a, **k); txn.commit(); return r
+    return wrapper
+
+class FakeDB:
+    def __init__(self): self.reset()
+    def reset(self): self.data = {}; self.reads = 0; self.queries = 0; self.commits = 0; self.listeners = []
+    def collection(self, name): return CollRef(self, name)
+    def collection_group(self, name): return CollRef(self, name)
+    def document(self, path):
+        col, id = path.rsplit('/', 1); return DocRef(self, col, id)
+    def batch(self): return Batch(self)
+    def transaction(self, **k): return Transaction(self)
+    def get_all(self, refs, field_paths=None, **k):
+        for r in refs:
+            s = r.get()
+            if field_paths and s._d is not None: s._d = {kk: v for kk, v in s._d.items() if kk in field_paths}
+            yield s
+
+DB = FakeDB()
+
+class FieldFilter:
+    def __init__(self, f, op, v): self.field_path = f; self.op_string = op; self.value = v
+
+def install():
+    fa = types.ModuleType('firebase_admin'); fa._apps = {}
+    fa.initialize_app = lambda *a, **k: fa._apps.setdefault('[DEFAULT]', object())
+    fa.get_app = lambda *a, **k: fa._apps['[DEFAULT]']
+    cred = types.ModuleType('firebase_admin.credentials'); cred.Certificate = lambda p: object()
+    auth = types.ModuleType('firebase_admin.auth')
+    class UserNotFoundError(Exception): pass
+    auth.UserNotFoundError = UserNotFoundError
+    def gube(e): raise UserNotFoundError(e)
+    auth.get_user_by_email = gube
+    auth.create_user = lambda **k: types.SimpleNamespace(uid='uid' + str(next(_counter)))
+    auth.delete_user = lambda u: None
+    fs = types.ModuleType('firebase_admin.firestore')
+    fs.client = lambda *a, **k: DB
+    fs.Increment = Increment; fs.ArrayUnion = ArrayUnion; fs.ArrayRemove = ArrayRemove; fs.DELETE_FIELD = DELETE_FIELD; fs.SERVER_TIMESTAMP = SERVER_TIMESTAMP
+    fs.Query = types.SimpleNamespace(DESCENDING='DESCENDING', ASCENDING='ASCENDING')
+    fs.FieldFilter = FieldFilter; fs.transactional = transactional; fs.FieldPath = types.SimpleNamespace(document_id=lambda: '__name__')
+    fa.credentials = cred; fa.auth = auth; fa.firestore = fs
+    sys.modules.update({'firebase_admin': fa, 'firebase_admin.credentials': cred, 'firebase_admin.auth': auth, 'firebase_admin.firestore': fs})
+    return DB
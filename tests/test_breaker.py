@@ -0,0 +1,78 @@
+import pytest
+
+
+class ServiceUnavailable(Exception):
+    pass
+
+
+class NotFound(Exception):
+    pass
+
+
+def half_open_layer(app):
+    breaker = app.CircuitBreaker(threshold=1, open_seconds=0)
+    breaker.record_failure()
+    assert breaker.state == 'half_open'
+    return breaker, app.ResilientFirestore(breaker)
+
+
+def ok(timeout=None, retry=None):
+    return 'ok'
+
+
+def stream(timeout=None, retry=None):
+    yield from ['a', 'b', 'c']
+
+
+def test_non_transient_probe_error_releases_probe(app):
+    breaker, layer = half_open_layer(app)
+
+    def get(timeout=None, retry=None):
+        raise NotFound('hilang')
+    with pytest.raises(NotFound):
+        layer.call(get, (), {}, retry=True)
+    assert layer.call(ok, (), {}, retry=True) == 'ok'
+    assert breaker.state == 'closed'
+
+
+def test_abandoned_probe_stream_releases_probe(app):
+    breaker, layer = half_open_layer(app)
+    assert next(iter(layer.call(stream, (), {}, retry=True))) == 'a'
+    for item in layer.call(stream, (), {}, retry=True):
+        break
+    assert layer.call(ok, (), {}, retry=True) == 'ok'
+    assert breaker.stats['rejected'] == 0
+
+
+def test_transient_probe_failure_reopens(app):
+    breaker = app.CircuitBreaker(threshold=1, open_seconds=60)
+    breaker.record_failure()
+    breaker._opened_at -= 61
+    layer = app.ResilientFirestore(breaker)
+
+    def get(timeout=None, retry=None):
+        raise ServiceUnavailable('down')
+    with pytest.raises(ServiceUnavailable):
+        layer.call(get, (), {}, retry=False)
+    assert breaker.state == 'open'
+    with pytest.raises(app.FirestoreUnavailable):
+        layer.call(ok, (), {}, retry=False)
+
+
+def test_background_stream_has_no_call_timeout(app):
+    layer = app.ResilientFirestore(app.CircuitBreaker())
+    seen = []
+
+    def stream(timeout=None, retry=None):
+        seen.append(timeout)
+        yield 'a'
+
+    def get(timeout=None, retry=None):
+        seen.append(timeout)
+        return 'ok'
+    list(layer.call(stream, (), {}, retry=True))
+    layer.call(get, (), {}, retry=True)
+    assert seen == [None, app.FIRESTORE_CALL_TIMEOUT]
+    with app.app.test_request_context('/'):
+        list(layer.call(stream, (), {}, retry=True))
+    assert seen[-1] == app.FIRESTORE_CALL_TIMEOUT
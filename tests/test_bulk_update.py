@@ -0,0 +1,47 @@
+import fake_firestore
+
+
+def test_bulk_update_reports_only_committed_chunks(app, client, db, monkeypatch):
+    db.data['products'] = {f'p{i:04d}': {'name': f'P{i}', 'stock': 5, 'price': 1000} for i in range(600)}
+    real_commit = fake_firestore.Batch.commit
+    calls = []
+
+    def flaky_commit(self, *a, **k):
+        calls.append(1)
+        if len(calls) == 2: raise RuntimeError('commit gagal')
+        return real_commit(self, *a, **k)
+    monkeypatch.setattr(fake_firestore.Batch, 'commit', flaky_commit)
+
+    changes = [{'product_id': f'p{i:04d}', 'stock_delta': 1} for i in range(600)] + [{'product_id': 'hilang', 'stock': 1}]
+    body = client.post('/products/bulk_update', json={'changes': changes}).get_json()
+    results = body['data']
+    limit = app.FIRESTORE_BATCH_LIMIT
+    assert all(r['status'] == 'ok' and r['stock'] == 6 for r in results[:limit])
+    assert all(r['status'] == 'error' and 'tidak diterapkan' in r['message'] for r in results[limit:600])
+    assert results[600]['status'] == 'error'
+    assert db.data['products']['p0000']['stock'] == 6
+    assert db.data['products']['p0599']['stock'] == 5
+    assert body['updated'] == limit
+
+
+def test_bulk_update_marks_all_ok_after_commit(app, client, db):
+    db.data['products'] = {'a': {'name': 'A', 'stock': 2, 'price': 500}}
+    body = client.post('/products/bulk_update', json={'changes': [{'product_id': 'a', 'stock': 7}]}).get_json()
+    assert body['data'] == [{'product_id': 'a', 'status': 'ok', 'stock': 7, 'price': 500}]
+
+
+def test_bulk_update_rejects_decimal_price_and_stock(app, client, db):
+    db.data['products'] = {p: {'name': p, 'stock': 2, 'price': 500} for p in ('a', 'b', 'c', 'd', 'e')}
+    changes = [{'product_id': 'a', 'price': '12.5'},
+               {'product_id': 'b', 'stock': 3.7},
+               {'product_id': 'c', 'stock_delta': '1.5'},
+               {'product_id': 'd', 'price': '12.500'},
+               {'product_id': 'e', 'stock': '4'}]
+    results = client.post('/products/bulk_update', json={'changes': changes}).get_json()['data']
+    assert [r['status'] for r in results] == ['error', 'error', 'error', 'ok', 'ok']
+    assert all(r['message'] == 'stok/harga harus angka bulat' for r in results[:3])
+    assert db.data['products']['a']['price'] == 500
+    assert db.data['products']['b']['stock'] == 2
+    assert db.data['products']['c']['stock'] == 2
+    assert db.data['products']['d']['price'] == 12500
+    assert db.data['products']['e']['stock'] == 4
@@ -0,0 +1,66 @@
+def checkout(client, **body):
+    body.setdefault('items', [{'product_id': 'p1', 'qty': 1}])
+    return client.post('/api/checkout', json=body)
+
+
+def test_reused_order_id_from_other_user_conflicts(app, client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 10}}
+    assert checkout(client, user_id='u1', order_id='ORD-1').get_json()['status'] == 'success'
+
+    r = checkout(client, user_id='u2', order_id='ORD-1')
+    assert r.status_code == 409
+    assert db.data['products']['p1']['stock'] == 9
+    assert db.data['transactions']['ORD-1']['user_id'] == 'u1'
+
+
+def test_retry_after_cache_loss_replays_same_order(app, client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 10}}
+    first = checkout(client, user_id='u1', order_id='ORD-2').get_json()
+    app.shared_cache = app.SharedCache(app.MemoryCacheBackend())
+    again = checkout(client, user_id='u1', order_id='ORD-2')
+    assert again.get_json()['data'] == first['data']
+    assert again.headers['Idempotent-Replayed'] == 'true'
+    assert db.data['products']['p1']['stock'] == 9
+
+
+def test_same_order_under_other_key_is_verified_against_transaction(app, client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 10}}
+    checkout(client, user_id='u1', order_id='ORD-3')
+    app.shared_cache = app.SharedCache(app.MemoryCacheBackend())
+    r = client.post('/api/checkout', json={'user_id': 'u1', 'order_id': 'ORD-3', 'items': [{'product_id': 'p1', 'qty': 1}]},
+                    headers={'Idempotency-Key': 'lain'})
+    assert r.get_json()['status'] == 'success'
+    r = client.post('/api/checkout', json={'user_id': 'u1', 'order_id': 'ORD-3', 'items': [{'product_id': 'p1', 'qty': 5}]},
+                    headers={'Idempotency-Key': 'lain-lagi'})
+    assert r.status_code == 409
+    assert db.data['products']['p1']['stock'] == 9
+
+
+def test_non_json_body_gets_json_error(client, db):
+    r = client.post('/api/checkout', data='bukan json', content_type='text/plain')
+    assert r.is_json
+    assert r.get_json()['status'] == 'error'
+
+
+def test_retry_on_cache_miss_after_stock_sold_out_replays(app, client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 1}}
+    first = checkout(client, user_id='u1', order_id='ORD-4')
+    assert first.get_json()['status'] == 'success'
+    assert db.data['products']['p1']['stock'] == 0
+
+    # Worker lain: cache in-memory kosong, stok sudah habis oleh checkout pertama
+    app.shared_cache = app.SharedCache(app.MemoryCacheBackend())
+    again = checkout(client, user_id='u1', order_id='ORD-4')
+    body = again.get_json()
+    assert body['status'] == 'success'
+    assert body['data']['order_id'] == 'ORD-4'
+    assert again.headers['Idempotent-Replayed'] == 'true'
+    assert len(db.data['transactions']) == 1
+
+
+def test_retry_with_changed_cart_still_conflicts(app, client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 1}}
+    checkout(client, user_id='u1', order_id='ORD-5')
+    app.shared_cache = app.SharedCache(app.MemoryCacheBackend())
+    r = checkout(client, user_id='u1', order_id='ORD-5', items=[{'product_id': 'p1', 'qty': 3}])
+    assert r.status_code == 409
@@ -0,0 +1,56 @@
+import json
+
+
+def pos_sale(client, phone, price_qty=2):
+    return client.post('/add_transaction', data={
+        'customer_name': 'Budi', 'customer_phone': phone, 'customer_address': '-',
+        'payment_method': 'Cash', 'cart_data': json.dumps([{'id': 'p1', 'qty': price_qty}]),
+    })
+
+
+def setup_product(db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 5000, 'stock': 100}}
+
+
+def test_pos_sale_finds_legacy_customer_by_phone_variant(app, client, db):
+    setup_product(db)
+    db.data['customers'] = {'lama': {'name': 'Budi', 'phone': '+6281234567', 'points': 1}}
+    pos_sale(client, '081234567')
+    assert db.data['customers']['lama']['points'] == 3
+    assert len(db.data['customers']) == 1
+    assert db.data['customer_phones']['081234567']['customer_id'] == 'lama'
+
+
+def test_pos_sale_recovers_from_stale_phone_index(app, client, db):
+    setup_product(db)
+    db.data['customer_phones'] = {'081234567': {'customer_id': 'terhapus', 'phone': '081234567'}}
+    pos_sale(client, '081234567')
+    assert len(db.data['transactions']) == 1
+    new_id = db.data['customer_phones']['081234567']['customer_id']
+    assert new_id != 'terhapus'
+    assert db.data['customers'][new_id]['points'] == 2
+    assert next(iter(db.data['transactions'].values()))['user_id'] == new_id
+
+
+def test_dedupe_repoints_app_reviews_by_user_id(app, db):
+    db.data['customers'] = {'a': {'name': 'A', 'phone': '0811', 'points': 5},
+                            'b': {'name': 'B', 'phone': '62811', 'points': 7}}
+    db.data['reviews'] = {'r1': {'user_id': 'b', 'rating': 5}, 'r2': {'customer_id': 'b', 'rating': 4}}
+    app.dedupe_customers()
+    assert db.data['reviews']['r1']['user_id'] == 'a'
+    assert db.data['reviews']['r2']['customer_id'] == 'a'
+    assert db.data['customers']['a']['points'] == 12
+    assert 'b' not in db.data['customers']
+
+
+def test_dedupe_rerun_after_partial_failure_does_not_double_points(app, db):
+    # Run sebelumnya sempat menambah poin (dan mencatat merged_from) lalu gagal sebelum menghapus duplikat
+    db.data['customers'] = {'a': {'name': 'A', 'phone': '0811', 'points': 12, 'merged_from': ['b']},
+                            'b': {'name': 'B', 'phone': '0811', 'points': 7}}
+    db.data['transactions'] = {'t1': {'user_id': 'b'}}
+    app.dedupe_customers()
+    assert db.data['customers']['a']['points'] == 12
+    assert 'b' not in db.data['customers']
+    assert db.data['transactions']['t1']['user_id'] == 'a'
+    app.dedupe_customers()
+    assert db.data['customers']['a']['points'] == 12
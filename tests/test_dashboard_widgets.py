@@ -0,0 +1,13 @@
+def test_checkout_does_not_invalidate_catalog_widgets(app, db, monkeypatch):
+    calls = []
+    widget = dict(app.DASHBOARD_WIDGETS['sales_ranking'], compute=lambda: calls.append(1) or {'n': len(calls)})
+    monkeypatch.setitem(app.DASHBOARD_WIDGETS, 'sales_ranking', widget)
+    cache = app.DashboardWidgetCache()
+
+    assert cache.get('sales_ranking')[0] == {'n': 1}
+    app.invalidate_stock()
+    assert cache.get('sales_ranking')[0] == {'n': 1}
+    assert len(calls) == 1
+
+    app.invalidate_catalog()
+    assert cache.get('sales_ranking')[0] == {'n': 2}
@@ -0,0 +1,33 @@
+def favorites(client, user_id):
+    return sorted(f['product_id'] for f in client.get(f'/api/favorites/{user_id}').get_json()['data'])
+
+
+def test_first_toggle_keeps_legacy_favorites(client, db):
+    db.data['products'] = {pid: {'name': pid, 'price': 1000} for pid in ('p1', 'p2', 'p3')}
+    db.data['favorites'] = {'acak1': {'customer_id': 'c1', 'product_id': 'p1'},
+                            'acak2': {'customer_id': 'c1', 'product_id': 'p2'}}
+    assert favorites(client, 'c1') == ['p1', 'p2']
+
+    r = client.post('/api/favorites/toggle', json={'user_id': 'c1', 'product_id': 'p3'})
+    assert r.get_json()['data'] == {'is_favorite': True}
+    assert favorites(client, 'c1') == ['p1', 'p2', 'p3']
+    assert sorted(db.data['favorite_sets']['c1']['product_ids']) == ['p1', 'p2', 'p3']
+    assert 'acak1' not in db.data['favorites'] and 'c1_p1' in db.data['favorites']
+
+
+def test_untoggle_legacy_favorite_removes_it(client, db):
+    db.data['favorites'] = {'acak1': {'customer_id': 'c1', 'product_id': 'p1'},
+                            'acak2': {'customer_id': 'c1', 'product_id': 'p2'}}
+    r = client.post('/api/favorites/toggle', json={'user_id': 'c1', 'product_id': 'p1'})
+    assert r.get_json()['data'] == {'is_favorite': False}
+    assert favorites(client, 'c1') == ['p2']
+    assert set(db.data['favorites']) == {'c1_p2'}
+
+
+def test_deleting_product_does_not_create_empty_set(client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi'}}
+    db.data['favorites'] = {'acak1': {'customer_id': 'c1', 'product_id': 'p1'},
+                            'acak2': {'customer_id': 'c1', 'product_id': 'p2'}}
+    client.get('/delete/p1')
+    assert 'c1' not in db.data.get('favorite_sets', {})
+    assert favorites(client, 'c1') == ['p2']
@@ -0,0 +1,17 @@
+def test_generate_id_is_monotonic_and_time_prefixed(app):
+    ids = [app.generate_id() for _ in range(3000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert all(len(i) == 23 and i.isdigit() for i in ids)
+
+
+def test_node_is_random_and_wide(app, monkeypatch):
+    monkeypatch.delenv('NODE_ID', raising=False)
+    nodes = {app._id_node() for _ in range(50)}
+    assert len(nodes) > 45
+    assert max(nodes) < app.ID_NODE_LIMIT and app.ID_NODE_LIMIT >= 2 ** 20
+
+
+def test_node_id_env_overrides(app, monkeypatch):
+    monkeypatch.setenv('NODE_ID', '42')
+    assert app._id_node() == 42
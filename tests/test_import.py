@@ -0,0 +1,41 @@
+import zipfile
+from io import BytesIO
+
+import pytest
+
+
+def test_import_int_accepts_thousands_and_rejects_decimals(app):
+    errors = []
+    assert app._import_int('12.500', 'price', errors) == 12500
+    assert app._import_int('1.250.000', 'price', errors) == 1250000
+    assert app._import_int(15000, 'price', errors) == 15000
+    assert app._import_int(15000.0, 'price', errors) == 15000
+    assert errors == []
+    for bad in ('12.5', '1.25', '12.50.0', 12.5):
+        assert app._import_int(bad, 'price', errors) is None
+    assert len(errors) == 4
+
+
+def test_import_rejects_oversized_zip_entry(app, db, monkeypatch):
+    monkeypatch.setattr(app, 'IMPORT_ZIP_ENTRY_MAX_BYTES', 1024)
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('besar.png', b'\0' * 100000)
+        zf.writestr('kecil.png', b'\x89PNG' + b'\0' * 10)
+    images = zipfile.ZipFile(BytesIO(buf.getvalue()))
+    rows = [{'name': 'A', 'price': '1000', 'stock': '1', 'image': 'besar.png'},
+            {'name': 'B', 'price': '1000', 'stock': '1', 'image': 'kecil.png'}]
+    report = app.import_products(rows, images)
+    assert report['imported'] == 1
+    assert report['errors'][0]['row'] == 1
+    assert 'terlalu besar' in report['errors'][0]['errors'][0]
+
+
+def test_read_import_image_bounds_read(app, monkeypatch):
+    monkeypatch.setattr(app, 'IMPORT_ZIP_ENTRY_MAX_BYTES', 1024)
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
+        zf.writestr('a.png', b'x' * 2048)
+    images = zipfile.ZipFile(BytesIO(buf.getvalue()))
+    with pytest.raises(ValueError, match='terlalu besar'):
+        app.read_import_image(images, 'a.png')
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+
+def test_full_resync_upserts_and_removes_without_emptying_tables(app, db, monkeypatch):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 5}}
+    db.data['transactions'] = {'t1': {'items': [{'product_id': 'p1', 'qty': 1, 'price': 1000}],
+                                      'created_at': '2024-01-05T10:00:00', 'summary': {'grand_total': 1000}}}
+    mirror = app.mirror_models()
+    with app.app.app_context():
+        app.mirror_full_resync()
+        db.data['products'] = {'p1': {'name': 'Kopi Susu', 'price': 1200, 'stock': 4},
+                               'p2': {'name': 'Teh', 'price': 800, 'stock': 2}}
+        db.data['transactions'] = {}
+
+        # Selama resync berjalan, baris lama harus tetap terbaca
+        real_stream = app.stream_collection
+        seen_counts = []
+        def watching_stream(name, page_size=500):
+            for doc in real_stream(name, page_size=page_size):
+                seen_counts.append(mirror.MirrorProduct.query.count())
+                yield doc
+        monkeypatch.setattr(app, 'stream_collection', watching_stream)
+
+        counts = app.mirror_full_resync(batch_size=1)
+        assert counts['products'] == 2 and counts['transactions'] == 0
+        assert min(seen_counts) >= 1
+        assert mirror.sql.session.get(mirror.MirrorProduct, 'p1').name == 'Kopi Susu'
+        assert mirror.MirrorOrder.query.count() == 0
+        assert mirror.MirrorOrderItem.query.count() == 0
+
+
+def test_undated_orders_are_mirrored_without_timestamp(app, db):
+    db.data['transactions'] = {
+        'ok': {'items': [{'product_id': 'p1', 'qty': 1, 'price': 1000}], 'created_at': '2024-01-05T10:00:00',
+               'summary': {'grand_total': 1000}},
+        'tanpa': {'items': [{'product_id': 'p1', 'qty': 2, 'price': 1000}], 'summary': {'grand_total': 2000}},
+        'rusak': {'product_id': 'p1', 'quantity': 1, 'final_price': 500, 'date': 'kemarin'},
+    }
+    mirror = app.mirror_models()
+    with app.app.app_context():
+        app.mirror_full_resync()
+        assert mirror.sql.session.get(mirror.MirrorOrder, 'ok').created_at.year == 2024
+        assert mirror.sql.session.get(mirror.MirrorOrder, 'tanpa').created_at is None
+        assert mirror.sql.session.get(mirror.MirrorOrder, 'rusak').created_at is None
+        daily_sales, peak_hours = app.mirror_sales_report()
+        assert daily_sales == {'2024-01-05': 1000}
+        assert peak_hours == {'10:00': 1}
+
+
+def test_sqlalchemy_not_imported_when_mirror_disabled(app):
+    env = {k: v for k, v in os.environ.items() if k != 'MIRROR_ENABLED'}
+    probe = "import sys, app; print('flask_sqlalchemy' in sys.modules, 'sqlalchemy' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', probe], cwd=os.path.dirname(app.__file__), env=env,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip().splitlines()[-1] == 'False False'
+    assert 'flask_sqlalchemy' in app.LAZY_MODULES
@@ -0,0 +1,18 @@
+def ids(docs):
+    return [d.id for d in docs]
+
+
+def test_prev_then_next_does_not_skip_documents(app, db):
+    db.data['products'] = {f'p{i:02d}': {'name': f'P{i}'} for i in range(30)}
+    query = app.db.collection('products')
+    page1, next1, prev1 = app.paginate_by_id(query, 10)
+    assert ids(page1) == [f'p{i:02d}' for i in range(10)] and prev1 is None
+    page2, next2, prev2 = app.paginate_by_id(query, 10, cursor=next1)
+    assert ids(page2) == [f'p{i:02d}' for i in range(10, 20)]
+
+    back, next_back, prev_back = app.paginate_by_id(query, 10, before=prev2)
+    assert ids(back) == ids(page1)
+    assert next_back == 'p09' and prev_back is None
+
+    again, _, _ = app.paginate_by_id(query, 10, cursor=next_back)
+    assert ids(again) == ids(page2)
@@ -0,0 +1,20 @@
+def test_backfill_skips_unparseable_dates(app, db):
+    db.data['products'] = {'p1': {'name': 'Kopi'}, 'p2': {'name': 'Teh'}}
+    db.data['transactions'] = {
+        'n1': {'items': [{'product_id': 'p1', 'qty': 2, 'price': 1000}], 'created_at': '2024-01-05T10:00:00'},
+        'f1': {'product_id': 'p2', 'quantity': 1, 'final_price': 900, 'discount_voucher': 100,
+               'date': 'January 6, 2024 at 09:00:00 AM UTC+7'},
+        'rusak': {'items': [{'product_id': 'p1', 'qty': 5, 'price': 1000}], 'created_at': 'kemarin sore'},
+        'kosong': {'product_id': 'p2', 'quantity': 3, 'final_price': 3000},
+    }
+    result = app.backfill_product_sales()
+    assert result['skipped'] == 2
+    p1, p2 = db.data['products']['p1'], db.data['products']['p2']
+    assert (p1['units_sold'], p1['revenue'], p1['last_sold_at']) == (2, 2000, '2024-01-05T10:00:00')
+    assert (p2['units_sold'], p2['revenue'], p2['last_sold_at']) == (1, 1000, '2024-01-06T09:00:00')
+    assert set(db.data['product_sales_daily']) == {'2024-01-05_p1', '2024-01-06_p2'}
+
+
+def test_transaction_exposes_product_id(app):
+    assert app.Transaction('a', {'product_id': 'p9', 'quantity': 1}).product_id == 'p9'
+    assert app.Transaction('b', {'items': []}).product_id is None
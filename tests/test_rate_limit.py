@@ -0,0 +1,61 @@
+def fresh_store(app, monkeypatch):
+    monkeypatch.setattr(app.admission, 'store', app.MemoryRateLimitStore())
+
+
+def test_spoofed_user_id_does_not_escape_ip_bucket(app, db, monkeypatch):
+    fresh_store(app, monkeypatch)
+    monkeypatch.setattr(app, 'RATE_LIMIT_BY_IP', True)
+    client = app.app.test_client()
+    burst = app.RATE_LIMITS['write'][1]
+    codes = [client.post('/api/favorites/toggle', json={'user_id': f'u{i}', 'product_id': 'p1'}).status_code
+             for i in range(burst + 1)]
+    assert 429 not in codes[:burst]
+    assert codes[-1] == 429
+
+
+def test_user_bucket_only_for_logged_in_session(app, client, db, monkeypatch):
+    fresh_store(app, monkeypatch)
+    monkeypatch.setattr(app, 'RATE_LIMIT_BY_IP', True)
+    with app.app.test_request_context('/api/user_points/999?user_id=999'):
+        assert app.rate_limit_clients('read') == ['ip:None']
+    client.get('/api/categories')
+    assert set(k.split(':', 1)[1].split(':')[0] for k in app.admission.store._buckets) == {'ip', 'u'}
+
+
+def test_checkout_behind_proxy_is_not_limited_store_wide(app, db, monkeypatch):
+    # Default: tanpa TRUST_PROXY semua klien berbagi IP proxy, jadi limit per IP tidak aktif
+    fresh_store(app, monkeypatch)
+    assert app.RATE_LIMIT_BY_IP is False
+    client = app.app.test_client()
+    burst = app.RATE_LIMITS['checkout'][1]
+    codes = [client.post('/api/checkout', json={'user_id': f'cust{i}', 'items': []},
+                         environ_base={'REMOTE_ADDR': '10.0.0.1'}).status_code
+             for i in range(burst * 3)]
+    assert 429 not in codes
+
+
+def test_checkout_limited_per_customer(app, db, monkeypatch):
+    fresh_store(app, monkeypatch)
+    client = app.app.test_client()
+    burst = app.RATE_LIMITS['checkout'][1]
+    codes = [client.post('/api/checkout', json={'user_id': 'cust1', 'items': []}).status_code
+             for i in range(burst + 1)]
+    assert codes[-1] == 429
+    assert client.post('/api/checkout', json={'user_id': 'cust2', 'items': []}).status_code != 429
+
+
+def test_trusted_proxy_keys_by_forwarded_ip(app, db, monkeypatch):
+    fresh_store(app, monkeypatch)
+    monkeypatch.setattr(app, 'TRUST_PROXY', True)
+    monkeypatch.setattr(app, 'RATE_LIMIT_BY_IP', True)
+    client = app.app.test_client()
+    burst = app.RATE_LIMITS['checkout'][1]
+    for i in range(burst):
+        client.post('/api/checkout', json={'items': []}, headers={'X-Forwarded-For': '1.1.1.1'},
+                    environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    blocked = client.post('/api/checkout', json={'items': []}, headers={'X-Forwarded-For': '1.1.1.1'},
+                          environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    other = client.post('/api/checkout', json={'items': []}, headers={'X-Forwarded-For': '2.2.2.2'},
+                        environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    assert blocked.status_code == 429
+    assert other.status_code != 429
@@ -0,0 +1,19 @@
+def test_index_build_skips_images_and_removes_by_term_list(app, db):
+    db.data['products'] = {
+        'p1': {'name': 'Kopi Susu', 'category': 'Minuman', 'price': 15000, 'image_base64': 'aGVsbG8='},
+        'p2': {'name': 'Teh Manis', 'category': 'Minuman', 'price': 8000, 'image_base64': 'aGVsbG8='},
+    }
+    index = app.ProductSearchIndex()
+    results = index.search('kopi')
+    assert [r['id'] for r in results] == ['p1']
+    assert all('image_base64' not in r for r in index.search(''))
+    assert index._terms['p1'] == ['kopi', 'susu', 'minuman']
+
+    index.remove('p1')
+    assert index.search('kopi') == []
+    assert 'susu' not in index._postings and 'susu' not in index._vocab
+    assert [r['id'] for r in index.search('minuman')] == ['p2']
+
+    index.upsert('p2', {'name': 'Teh Tarik', 'category': 'Minuman', 'price': 9000})
+    assert index.search('manis') == []
+    assert [r['id'] for r in index.search('tarik')] == ['p2']
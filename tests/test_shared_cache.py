@@ -0,0 +1,43 @@
+def test_version_keys_survive_lru_eviction(app):
+    backend = app.MemoryCacheBackend(max_bytes=100)
+    cache = app.SharedCache(backend)
+    cache.bump_catalog()
+    version = cache.catalog_version()
+    for i in range(50):
+        cache.set(f'k{i}', b'x' * 40, 60)
+    assert cache.catalog_version() == version
+
+
+def test_missing_version_is_seeded_not_zero(app):
+    cache = app.SharedCache(app.MemoryCacheBackend())
+    version = cache.catalog_version()
+    assert version > 0
+    assert cache.catalog_version() == version
+    cache.bump_catalog()
+    assert cache.catalog_version() == version + 1
+
+
+def test_checkout_does_not_collapse_catalog_cache(app, client, db, monkeypatch):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 10}}
+    version = app.shared_cache.catalog_version()
+    assert client.get('/api/products').get_json()['data'][0]['stock'] == 10
+
+    r = client.post('/api/checkout', json={'items': [{'product_id': 'p1', 'qty': 2}]})
+    assert r.get_json()['status'] == 'success'
+    assert app.shared_cache.catalog_version() == version
+
+    queries = db.queries
+    assert client.get('/api/products').get_json()['data'][0]['stock'] == 10
+    assert db.queries == queries
+
+    # Setelah CATALOG_STOCK_MAX_AGE lewat, stok baru terbaca
+    monkeypatch.setattr(app, 'CATALOG_STOCK_MAX_AGE', 0)
+    assert client.get('/api/products').get_json()['data'][0]['stock'] == 8
+
+
+def test_catalog_edit_invalidates_immediately(app, client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'price': 1000, 'stock': 10}}
+    client.get('/api/products')
+    db.data['products']['p1']['name'] = 'Kopi Susu'
+    app.invalidate_catalog('p1')
+    assert client.get('/api/products').get_json()['data'][0]['name'] == 'Kopi Susu'
@@ -0,0 +1,51 @@
+def test_reviews_keep_undated_docs_and_sort_mixed_formats(client, db):
+    db.data['reviews'] = {
+        'a': {'comment': 'iso-lama', 'rating': 4, 'created_at': '2023-12-31T08:00:00'},
+        'b': {'comment': 'flutter-baru', 'rating': 5, 'created_at': 'January 5, 2024 at 10:00:00 AM UTC+7'},
+        'c': {'comment': 'iso-tengah', 'rating': 3, 'created_at': '2024-01-02T09:00:00'},
+        'd': {'comment': 'tanpa-tanggal', 'rating': 2},
+    }
+    html = client.get('/reviews').get_data(as_text=True)
+    positions = [html.index(c) for c in ('tanpa-tanggal', 'flutter-baru', 'iso-tengah', 'iso-lama')]
+    assert positions == sorted(positions)
+
+
+def test_date_sort_keys_order_parsed_dates(app, db):
+    db.data['favorites'] = {
+        'x': {'created_at': 'February 1, 2024 at 09:00:00 AM UTC+7'},
+        'y': {'created_at': '2024-01-15T09:00:00'},
+        'z': {},
+    }
+    pages = list(app.iter_collection_by_date('favorites'))
+    assert [d.id for page in pages for d in page] == ['z', 'x', 'y']
+
+
+def test_transactions_merge_nested_and_legacy_by_date(client, db):
+    db.data['transactions'] = {
+        'n1': {'items': [{'product_name': 'Nested-Baru', 'qty': 1, 'price': 1000}],
+               'created_at': 'March 1, 2024 at 10:00:00 AM UTC+7', 'summary': {'grand_total': 1000}},
+        'n2': {'items': [{'product_name': 'Nested-Lama', 'qty': 1, 'price': 1000}],
+               'created_at': '2024-01-01T10:00:00', 'summary': {'grand_total': 1000}},
+        'f1': {'product_id': 'sudah-dihapus', 'quantity': 2, 'final_price': 2000,
+               'date': '2024-02-01T10:00:00', 'customer_name': 'Flat'},
+    }
+    html = client.get('/transactions').get_data(as_text=True)
+    positions = [html.index(s) for s in ('Nested-Baru', 'Produk Terhapus', 'Nested-Lama')]
+    assert positions == sorted(positions)
+
+
+def test_transactions_key_pass_is_projected(app, client, db, monkeypatch):
+    db.data['transactions'] = {
+        'n1': {'items': [{'product_name': 'Kopi', 'qty': 1, 'price': 1000}], 'created_at': '2024-03-01T10:00:00',
+               'summary': {'grand_total': 1000}},
+    }
+    real_stream = app.stream_collection
+    calls = []
+
+    def spying_stream(name, page_size=app.EXPORT_PAGE_SIZE, fields=None):
+        calls.append((name, fields))
+        return real_stream(name, page_size=page_size, fields=fields)
+    monkeypatch.setattr(app, 'stream_collection', spying_stream)
+    assert 'Kopi' in client.get('/transactions').get_data(as_text=True)
+    assert calls == [('transactions', app.TRANSACTION_KEY_FIELDS)]
+    assert 'items' not in app.TRANSACTION_KEY_FIELDS and 'summary' not in app.TRANSACTION_KEY_FIELDS
@@ -0,0 +1,18 @@
+def test_transaction_skips_malformed_nested_items(app):
+    t = app.Transaction('t1', {'items': [None, 'rusak', {'product_id': 'p1', 'qty': '2', 'price': '1000'}],
+                               'summary': 'bukan dict', 'created_at': '2024-01-05T10:00:00'})
+    assert t.is_nested
+    assert [i['qty'] for i in t.items] == [2]
+    assert t.total_quantity == 2
+    assert t.final_price == 0
+
+
+def test_transactions_page_survives_malformed_items(client, db):
+    db.data['transactions'] = {
+        'ok': {'items': [{'product_name': 'Kopi', 'qty': 1, 'price': 1000}], 'created_at': '2024-01-05T10:00:00',
+               'summary': {'grand_total': 1000}},
+        'bad': {'items': ['x', 3], 'created_at': '2024-01-06T10:00:00', 'summary': {'grand_total': 0}},
+    }
+    r = client.get('/transactions')
+    assert r.status_code == 200
+    assert b'Kopi' in r.data
@@ -0,0 +1,55 @@
+from flask import session
+from werkzeug.security import check_password_hash
+
+
+def stale_copy(app):
+    return app._user_cache['1']
+
+
+def test_stale_cache_rejected_after_password_change_elsewhere(app, client, db):
+    client.get('/profile')
+    stale = stale_copy(app)
+    r = client.post('/change_password', data={'old_password': 'rahasia', 'new_password': 'baru123',
+                                               'confirm_password': 'baru123'})
+    assert r.status_code == 302
+    assert db.data['users']['1']['version'] == 1
+    with client.session_transaction() as sess:
+        assert sess['user_version'] == 1
+
+    # Worker lain masih memegang salinan versi 0; cookie session sudah membawa versi 1
+    app._user_cache['1'] = stale
+    reads = db.reads
+    client.get('/profile')
+    assert db.reads > reads
+    cached_at, data = app._user_cache['1']
+    assert data['version'] == 1
+    assert check_password_hash(data['password_hash'], 'baru123')
+
+
+def test_stale_cache_rejected_after_profile_change(app, client, db):
+    client.get('/profile')
+    stale = stale_copy(app)
+    client.post('/update_profile', data={'full_name': 'Admin Baru', 'email': 'a@b.c', 'address': '-'})
+    app._user_cache['1'] = stale
+    client.get('/profile')
+    assert app._user_cache['1'][1]['full_name'] == 'Admin Baru'
+
+
+def test_newer_version_from_other_process_forces_reload(app, db):
+    with app.app.test_request_context('/'):
+        app.load_user('1')
+        assert app._user_cache['1'][1].get('version', 0) == 0
+        # Proses lain menaikkan versi di Firestore dan di cookie session
+        db.data['users']['1'].update(version=3, full_name='Dari Worker Lain')
+        session['user_version'] = 3
+        user = app.load_user('1')
+        assert user._data['full_name'] == 'Dari Worker Lain'
+        assert session['user_version'] == 3
+
+
+def test_fresh_cache_skips_firestore(app, db):
+    with app.app.test_request_context('/'):
+        app.load_user('1')
+        reads = db.reads
+        app.load_user('1')
+        assert db.reads == reads
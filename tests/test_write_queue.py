@@ -0,0 +1,45 @@
+import time
+
+
+def test_updates_within_window_are_flushed_together(app, db):
+    db.data['products'] = {f'p{i}': {'stock': 0} for i in range(20)}
+    queue = app.DeferredWriteQueue(flush_interval=0.3)
+    start = time.monotonic()
+    for i in range(20):
+        queue.update(db.collection('products').document(f'p{i % 5}'), {'stock': app.firestore.Increment(1)})
+        time.sleep(0.005)
+    assert db.commits == 0
+    while queue.stats['written'] < 5 and time.monotonic() - start < 3:
+        time.sleep(0.02)
+    assert db.commits == 1
+    assert queue.stats['coalesced'] == 15
+    assert [db.data['products'][f'p{i}']['stock'] for i in range(5)] == [4] * 5
+    queue.close()
+
+
+def test_full_queue_flushes_before_window_ends(app, db, monkeypatch):
+    monkeypatch.setattr(app, 'WRITE_QUEUE_MAX_PENDING', 10)
+    db.data['products'] = {f'p{i}': {'stock': 0} for i in range(10)}
+    queue = app.DeferredWriteQueue(flush_interval=30)
+    for i in range(10):
+        queue.update(db.collection('products').document(f'p{i}'), {'stock': 1})
+    deadline = time.monotonic() + 3
+    while queue.stats['written'] < 10 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert queue.stats['written'] == 10
+    queue.close()
+
+
+def test_close_flushes_pending_updates(app, db):
+    db.data['products'] = {'p1': {'stock': 0}}
+    queue = app.DeferredWriteQueue(flush_interval=30)
+    queue.update(db.collection('products').document('p1'), {'stock': 7})
+    queue.close(timeout=2)
+    assert db.data['products']['p1']['stock'] == 7
+
+
+def test_rating_estimate_for_legacy_product_uses_existing_reviews(client, db):
+    db.data['products'] = {'p1': {'name': 'Kopi', 'rating': 5}}
+    db.data['reviews'] = {'r1': {'product_id': 'p1', 'rating': 5}, 'r2': {'product_id': 'p1', 'rating': 3}}
+    r = client.post('/api/add_review', json={'user_id': 'c1', 'product_id': 'p1', 'rating': 4})
+    assert r.get_json()['data'] == {'new_rating': 4.0}